@@ -4,49 +4,195 @@
 """
 
 import os
+import sys
+import json
 import argparse
-from pathlib import Path
+from fnmatch import fnmatch
+from concurrent.futures import ThreadPoolExecutor
 
+DEFAULT_IGNORE = [".git", "__pycache__", "face_recog_env", "venv", "node_modules", ".vscode"]
 
-def tree(directory, ignore=None, level=0, max_level=None, prefix=""):
-    """生成目录树形结构"""
+BRANCH = "├── "
+TEE = "│   "
+LAST = "└── "
+SPACE = "    "
+
+# 并行模式下最多提前读取的目录数，限制预读占用的内存
+PREFETCH_WINDOW = 64
+
+
+def is_ignored(name, ignore):
+    """判断名称是否匹配任一忽略规则（支持 glob 通配符，如 *.pyc）"""
+    return any(name == pattern or fnmatch(name, pattern) for pattern in ignore)
+
+
+def scan_dir(directory, ignore):
+    """使用 os.scandir 读取目录，返回排序后的可见条目列表
+
+    DirEntry 会缓存文件类型信息，避免对每个条目再单独调用 stat。
+    符号链接指向的目录不会被展开，以免出现循环。
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = [
+                entry for entry in it
+                if not entry.name.startswith('.') and not is_ignored(entry.name, ignore)
+            ]
+    except OSError:
+        # 无权限或目录在遍历过程中被删除时直接跳过
+        return []
+    entries.sort(key=lambda entry: entry.name)
+    return entries
+
+
+def check_root(directory):
+    """确认根目录可读；与子目录不同，根目录出错时直接抛出异常"""
+    os.scandir(directory).close()
+
+
+def _is_dir(entry):
+    try:
+        return entry.is_dir(follow_symlinks=False)
+    except OSError:
+        return False
+
+
+class Prefetcher:
+    """在线程池中预读目录内容，最多同时挂起 window 个目录
+
+    只由主线程调用 prefetch/get，工作线程只执行 scan，不会互相等待；
+    因此任意深度的目录都能并行读取，而输出仍按顺序流式写出。
+    """
+
+    def __init__(self, executor, scan, window=PREFETCH_WINDOW):
+        self.executor = executor
+        self.scan = scan
+        self.window = window
+        self.pending = {}
+
+    def prefetch(self, paths):
+        for path in paths:
+            if len(self.pending) >= self.window:
+                break
+            if path not in self.pending:
+                self.pending[path] = self.executor.submit(self.scan, path)
+
+    def get(self, path):
+        future = self.pending.pop(path, None)
+        return future.result() if future is not None else self.scan(path)
+
+
+def iter_tree(directory, ignore=None, level=0, max_level=None, prefix="", executor=None):
+    """逐行生成目录树形结构（生成器，适合超大目录树的流式输出）
+
+    若提供 executor（线程池），则即将遍历的目录会被提前并行读取，
+    结果按原有顺序逐行输出。
+    """
     if ignore is None:
-        ignore = [".git", "__pycache__", "face_recog_env", "venv", "node_modules", ".vscode"]
+        ignore = DEFAULT_IGNORE
 
+    check_root(directory)
+    prefetcher = None
+    if executor is not None:
+        prefetcher = Prefetcher(executor, lambda path: scan_dir(path, ignore))
+    return _iter_tree(directory, ignore, level, max_level, prefix, prefetcher)
+
+
+def _iter_tree(directory, ignore, level, max_level, prefix, prefetcher):
     if max_level is not None and level > max_level:
-        return ""
-
-    space = "│   " * level
-    branch = "├── "
-    tee = "│   "
-    last = "└── "
-
-    result = ""
-    
-    # 获取目录中的项目并排序
-    items = os.listdir(directory)
-    items = sorted([item for item in items if item not in ignore])
-    
-    # 计算非隐藏目录和文件
-    visible_items = [item for item in items if not item.startswith('.')]
+        return
+
+    if prefetcher is not None:
+        entries = prefetcher.get(directory)
+        if max_level is None or level < max_level:
+            prefetcher.prefetch(entry.path for entry in entries if _is_dir(entry))
+    else:
+        entries = scan_dir(directory, ignore)
 
     # 遍历目录中的项目
-    for i, item in enumerate(visible_items):
-        path = Path(directory) / item
-        
+    for i, entry in enumerate(entries):
         # 确定是否为最后一项
-        is_last = i == len(visible_items) - 1
-        curr_prefix = prefix + (last if is_last else branch)
-        next_prefix = prefix + ("    " if is_last else tee)
-        
+        is_last = i == len(entries) - 1
+        curr_prefix = prefix + (LAST if is_last else BRANCH)
+        next_prefix = prefix + (SPACE if is_last else TEE)
+
         # 输出当前项
-        result += f"{curr_prefix}{item}\n"
-        
+        yield f"{curr_prefix}{entry.name}\n"
+
         # 如果是目录，递归生成子目录树
-        if path.is_dir() and item not in ignore:
-            result += tree(path, ignore, level + 1, max_level, next_prefix)
-    
-    return result
+        if _is_dir(entry):
+            yield from _iter_tree(entry.path, ignore, level + 1, max_level, next_prefix, prefetcher)
+
+
+def tree(directory, ignore=None, level=0, max_level=None, prefix=""):
+    """生成目录树形结构"""
+    return "".join(iter_tree(directory, ignore, level, max_level, prefix))
+
+
+def scan_sizes(directory, ignore):
+    """读取目录，返回 (子目录路径列表, 文件数, 文件总大小)"""
+    subdirs = []
+    files = size = 0
+    for entry in scan_dir(directory, ignore):
+        if _is_dir(entry):
+            subdirs.append(entry.path)
+            continue
+        files += 1
+        try:
+            size += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            pass
+    return subdirs, files, size
+
+
+def summarize(directory, ignore=None, level=0, max_level=None, executor=None):
+    """统计目录信息，返回包含文件数、总大小及子目录的字典
+
+    files 与 size 为整个子树的累计值，因此总会遍历整棵目录树；
+    children 只展开到 max_level 深度。
+    """
+    if ignore is None:
+        ignore = DEFAULT_IGNORE
+
+    check_root(directory)
+    prefetcher = None
+    if executor is not None:
+        prefetcher = Prefetcher(executor, lambda path: scan_sizes(path, ignore))
+    return _summarize(directory, ignore, level, max_level, prefetcher)
+
+
+def _summarize(directory, ignore, level, max_level, prefetcher):
+    if prefetcher is not None:
+        subdirs, files, size = prefetcher.get(directory)
+        prefetcher.prefetch(subdirs)
+    else:
+        subdirs, files, size = scan_sizes(directory, ignore)
+
+    node = {
+        "name": os.path.basename(directory) or directory,
+        "path": directory,
+        "files": files,
+        "size": size,
+        "children": [],
+    }
+
+    children = [_summarize(path, ignore, level + 1, max_level, prefetcher) for path in subdirs]
+    for child in children:
+        node["files"] += child["files"]
+        node["size"] += child["size"]
+
+    if max_level is None or level <= max_level:
+        node["children"] = children
+    return node
+
+
+def write_tree(out, directory, ignore, max_level, executor=None):
+    """将 Markdown 格式的树形结构流式写入 out"""
+    base_name = os.path.basename(directory)
+    out.write(f"# {base_name}\n\n```\n{base_name}\n")
+    for line in iter_tree(directory, ignore, max_level=max_level, executor=executor):
+        out.write(line)
+    out.write("\n```")
 
 
 def main():
@@ -54,24 +200,43 @@ def main():
     parser = argparse.ArgumentParser(description='生成项目目录树')
     parser.add_argument('-d', '--directory', default='.', help='要生成树形图的目录路径')
     parser.add_argument('-l', '--level', type=int, default=3, help='最大深度级别')
-    parser.add_argument('-i', '--ignore', nargs='+', default=None, help='要忽略的目录或文件')
+    parser.add_argument('-i', '--ignore', nargs='+', default=None,
+                        help='要忽略的目录或文件，支持 glob 通配符（如 "*.pyc"）')
     parser.add_argument('-o', '--output', help='输出文件路径，若不指定则打印到控制台')
-    
+    parser.add_argument('-j', '--jobs', type=int, default=0,
+                        help='并行预读目录的线程数，0 表示不使用并行；'
+                             f'最多提前读取 {PREFETCH_WINDOW} 个目录，输出仍为流式')
+    parser.add_argument('--json', action='store_true',
+                        help='以 JSON 格式输出各目录的文件数与大小；为统计总数会遍历整个目录树，'
+                             '-l 只限制 children 的展开深度')
+
     args = parser.parse_args()
-    
+
     directory = os.path.abspath(args.directory)
-    base_name = os.path.basename(directory)
-    
-    # 生成树形结构
-    result = f"# {base_name}\n\n```\n{base_name}\n{tree(directory, args.ignore, max_level=args.level)}\n```"
-    
-    # 输出结果
+    if not os.path.isdir(directory):
+        parser.error(f"不是有效的目录: {args.directory}")
+
+    executor = ThreadPoolExecutor(max_workers=args.jobs) if args.jobs > 0 else None
+
+    try:
+        out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+        try:
+            if args.json:
+                json.dump(summarize(directory, args.ignore, max_level=args.level, executor=executor),
+                          out, ensure_ascii=False, indent=2)
+            else:
+                write_tree(out, directory, args.ignore, args.level, executor)
+            if not args.output:
+                out.write("\n")
+        finally:
+            if args.output:
+                out.close()
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
     if args.output:
-        with open(args.output, 'w', encoding='utf-8') as f:
-            f.write(result)
         print(f"项目结构已保存到 {args.output}")
-    else:
-        print(result)
 
 
 if __name__ == "__main__":
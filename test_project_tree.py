@@ -0,0 +1,111 @@
+"""project_tree.py 的测试"""
+
+import os
+import sys
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from project_tree import tree, iter_tree, summarize
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "project_tree.py")
+
+
+@pytest.fixture
+def project(tmp_path):
+    """构建一个小型目录树：
+
+    project/
+    ├── README.md      (5 字节)
+    ├── app.py         (10 字节)
+    ├── src/
+    │   ├── main.py    (20 字节)
+    │   └── pkg/
+    │       └── util.pyc (3 字节)
+    ├── __pycache__/   (默认忽略)
+    └── .hidden        (隐藏文件)
+    """
+    root = tmp_path / "project"
+    (root / "src" / "pkg").mkdir(parents=True)
+    (root / "__pycache__").mkdir()
+    (root / "README.md").write_bytes(b"x" * 5)
+    (root / "app.py").write_bytes(b"x" * 10)
+    (root / "src" / "main.py").write_bytes(b"x" * 20)
+    (root / "src" / "pkg" / "util.pyc").write_bytes(b"x" * 3)
+    (root / "__pycache__" / "app.cpython.pyc").write_bytes(b"x")
+    (root / ".hidden").write_bytes(b"x")
+    return root
+
+
+def test_tree_format(project):
+    assert tree(str(project)) == (
+        "├── README.md\n"
+        "├── app.py\n"
+        "└── src\n"
+        "    ├── main.py\n"
+        "    └── pkg\n"
+        "        └── util.pyc\n"
+    )
+
+
+def test_tree_max_level(project):
+    assert tree(str(project), max_level=0) == "├── README.md\n├── app.py\n└── src\n"
+
+
+def test_glob_ignore(project):
+    assert tree(str(project), ignore=["*.py", "pkg", "__*__"]) == "├── README.md\n└── src\n"
+
+
+def test_parallel_matches_serial(project):
+    for i in range(20):
+        (project / "src" / f"dir{i:02d}" / "sub").mkdir(parents=True)
+        (project / "src" / f"dir{i:02d}" / "sub" / "f.txt").write_text("x")
+    serial = tree(str(project))
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert "".join(iter_tree(str(project), executor=executor)) == serial
+
+
+def test_summarize_totals(project):
+    node = summarize(str(project))
+    assert (node["files"], node["size"]) == (4, 38)
+    src = node["children"][0]
+    assert (src["name"], src["files"], src["size"]) == ("src", 2, 23)
+    assert src["children"][0]["name"] == "pkg"
+
+
+def test_summarize_max_level(project):
+    node = summarize(str(project), max_level=0)
+    src = node["children"][0]
+    assert src["name"] == "src"
+    assert src["children"] == []
+    # 超出深度的部分仍计入总数
+    assert (node["files"], node["size"]) == (4, 38)
+
+
+def test_summarize_parallel(project):
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert summarize(str(project), executor=executor) == summarize(str(project))
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="不支持符号链接")
+def test_symlinked_dir_not_descended(project):
+    (project / "link").symlink_to(project / "src", target_is_directory=True)
+    output = tree(str(project))
+    assert "├── link\n" in output
+    assert output.count("main.py") == 1
+
+
+def test_missing_root_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        tree(str(tmp_path / "missing"))
+    with pytest.raises(FileNotFoundError):
+        summarize(str(tmp_path / "missing"))
+
+
+@pytest.mark.parametrize("name", ["missing", "file.txt"])
+def test_cli_rejects_invalid_root(tmp_path, name):
+    (tmp_path / "file.txt").write_text("x")
+    result = subprocess.run([sys.executable, SCRIPT, "-d", str(tmp_path / name)],
+                            capture_output=True)
+    assert result.returncode != 0